@@ -1,46 +1,86 @@
-import json
+import sys
 from datetime import datetime
-from pathlib import Path
-from typing import Optional
+from itertools import chain
+from typing import List, Optional, Tuple
 
+import aiofiles
 import yaml
 from rich.console import Console
 from rich.table import Table
 
 from src.cli.models import BenchmarkResult
-from src.core.constants import DEFAULT_MARKDOWN_FILENAME
+from src.core.constants import DEFAULT_MARKDOWN_FILENAME, PLAIN_TABLE_MAX_ROWS
 
+TABLE_HEADERS = (
+    "Concurrency",
+    "Generation Throughput (tokens/s)",
+    "Per-User Generation (tokens/s)",
+    "Prompt Throughput (tokens/s)",
+    "Effective Prompt Throughput (tokens/s)",
+    "Cached Token Rate",
+    "Min TTFT (s)",
+    "Max TTFT (s)",
+    "Success Rate",
+)
 
-def format_console(result: BenchmarkResult) -> str:
-    """Format benchmark results for console display using Rich tables.
 
-    Displays results in a formatted table with summary information.
+def _format_rows(result: BenchmarkResult) -> List[Tuple[str, ...]]:
+    """Format each speed result as a row of display strings.
+
+    Shared by the console and Markdown formatters so that the values are
+    only formatted once when both outputs are produced.
 
     Args:
-        result: BenchmarkResult containing all measurement data.
+        result: BenchmarkResult containing the rows to format.
 
     Returns:
-        Empty string (output is printed directly to console).
+        One tuple of cell strings per result, ordered as TABLE_HEADERS.
     """
-    console = Console()
-    table = Table(title="Benchmark Results")
-
-    table.add_column("Concurrency", justify="right")
-    table.add_column("Generation Throughput (tokens/s)", justify="right")
-    table.add_column("Prompt Throughput (tokens/s)", justify="right")
-    table.add_column("Min TTFT (s)", justify="right")
-    table.add_column("Max TTFT (s)", justify="right")
-    table.add_column("Success Rate", justify="right")
-
-    for r in result.results:
-        table.add_row(
+    return [
+        (
             str(r.concurrency),
             f"{r.generation_speed:.2f}",
+            f"{r.generation_speed_per_user:.2f}",
             f"{r.prompt_throughput:.2f}",
+            f"{r.effective_prompt_throughput:.2f}",
+            f"{r.cached_token_rate:.2%}",
             f"{r.min_ttft:.2f}",
             f"{r.max_ttft:.2f}",
             f"{r.success_rate:.2%}",
         )
+        for r in result.results
+    ]
+
+
+def format_console(result: BenchmarkResult, rows: Optional[List[Tuple[str, ...]]] = None) -> str:
+    """Format benchmark results for console display.
+
+    Displays results in a formatted table with summary information. Small
+    tables, and any table when stdout is not a terminal, are printed as
+    plain aligned text; Rich is only used for larger tables on a TTY.
+
+    Args:
+        result: BenchmarkResult containing all measurement data.
+        rows: Optional pre-formatted rows from _format_rows.
+
+    Returns:
+        Empty string (output is printed directly to console).
+    """
+    if rows is None:
+        rows = _format_rows(result)
+
+    if not sys.stdout.isatty() or len(rows) <= PLAIN_TABLE_MAX_ROWS:
+        _print_plain_table(result, rows)
+        return ""
+
+    console = Console()
+    table = Table(title="Benchmark Results")
+
+    for header in TABLE_HEADERS:
+        table.add_column(header, justify="right")
+
+    for row in rows:
+        table.add_row(*row)
 
     console.print(f"Input Tokens: {result.input_tokens}")
     console.print(f"Output Tokens: {result.output_tokens}")
@@ -52,6 +92,29 @@ def format_console(result: BenchmarkResult) -> str:
     return ""  # Console output doesn't return string
 
 
+def _print_plain_table(result: BenchmarkResult, rows: List[Tuple[str, ...]]):
+    """Print the summary and a right-aligned text table without Rich.
+
+    Args:
+        result: BenchmarkResult containing the summary information.
+        rows: Pre-formatted rows from _format_rows.
+    """
+    widths = [len(header) for header in TABLE_HEADERS]
+    for row in rows:
+        widths = [max(width, len(cell)) for width, cell in zip(widths, row)]
+
+    lines = [
+        f"Input Tokens: {result.input_tokens}",
+        f"Output Tokens: {result.output_tokens}",
+        f"Test Model: {result.model_name}",
+        f"Latency: {result.latency:.2f} ms",
+        "",
+        "  ".join(header.rjust(width) for header, width in zip(TABLE_HEADERS, widths)),
+    ]
+    lines.extend("  ".join(cell.rjust(width) for cell, width in zip(row, widths)) for row in rows)
+    print("\n".join(lines))
+
+
 def format_json(result: BenchmarkResult) -> str:
     """Format benchmark results as JSON string.
 
@@ -61,7 +124,7 @@ def format_json(result: BenchmarkResult) -> str:
     Returns:
         JSON formatted string with indentation.
     """
-    return json.dumps(result.model_dump(), indent=2)
+    return result.model_dump_json(indent=2)
 
 
 def format_yaml(result: BenchmarkResult) -> str:
@@ -76,54 +139,53 @@ def format_yaml(result: BenchmarkResult) -> str:
     return yaml.dump(result.model_dump())
 
 
-def format_markdown(result: BenchmarkResult) -> str:
+def format_markdown(result: BenchmarkResult, rows: Optional[List[Tuple[str, ...]]] = None) -> str:
     """Format benchmark results as Markdown table.
 
     Args:
         result: BenchmarkResult to format.
+        rows: Optional pre-formatted rows from _format_rows.
 
     Returns:
         Markdown string with summary and table.
     """
-    lines = []
-    lines.append(f"Input Tokens: {result.input_tokens}")
-    lines.append(f"Output Tokens: {result.output_tokens}")
-    lines.append(f"Test Model: {result.model_name}")
-    lines.append(f"Latency: {result.latency:.2f} ms")
-    lines.append("")
-headers = ["Concurrency", "Generation Throughput (tokens/s)", "Prompt Throughput (tokens/s)", "Min TTFT (s)", "Max TTFT (s)", "Success Rate"]
-
-    lines.append("| " + " | ".join(headers) + " |")
-    lines.append("| " + " | ".join("---" for _ in headers) + " |")
-
-    for r in result.results:
-        row = [
-            str(r.concurrency),
-            f"{r.generation_speed:.2f}",
-            f"{r.prompt_throughput:.2f}",
-            f"{r.min_ttft:.2f}",
-            f"{r.max_ttft:.2f}",
-            f"{r.success_rate:.2%}",
-        ]
-        lines.append("| " + " | ".join(row) + " |")
-
-    return "\n".join(lines)
-
-
-def save_markdown(result: BenchmarkResult, filename: str = DEFAULT_MARKDOWN_FILENAME):
-    """Save benchmark results to a Markdown file.
+    if rows is None:
+        rows = _format_rows(result)
+
+    summary = (
+        f"Input Tokens: {result.input_tokens}",
+        f"Output Tokens: {result.output_tokens}",
+        f"Test Model: {result.model_name}",
+        f"Latency: {result.latency:.2f} ms",
+        "",
+        "| " + " | ".join(TABLE_HEADERS) + " |",
+        "| " + " | ".join("---" for _ in TABLE_HEADERS) + " |",
+    )
+    lines = ("| " + " | ".join(row) + " |" for row in rows)
+
+    return "\n".join(chain(summary, lines))
+
+
+async def save_markdown_async(
+    result: BenchmarkResult,
+    filename: str = DEFAULT_MARKDOWN_FILENAME,
+    rows: Optional[List[Tuple[str, ...]]] = None,
+):
+    """Save benchmark results to a Markdown file without blocking the event loop.
 
     Args:
         result: BenchmarkResult to save.
         filename: Output filename (default: DEFAULT_MARKDOWN_FILENAME).
+        rows: Optional pre-formatted rows from _format_rows.
     """
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     filename = f"{timestamp}_{filename}"
-    content = format_markdown(result)
-    Path(filename).write_text(content)
+    content = format_markdown(result, rows)
+    async with aiofiles.open(filename, "w") as f:
+        await f.write(content)
 
 
-def output_result(result: BenchmarkResult, output_format: Optional[str] = None):
+async def output_result(result: BenchmarkResult, output_format: Optional[str] = None):
     """Output benchmark results in the specified format.
 
     Displays results to console and always saves a Markdown file.
@@ -132,12 +194,14 @@ def output_result(result: BenchmarkResult, output_format: Optional[str] = None):
         result: BenchmarkResult to output.
         output_format: Format type ("json", "yaml", or None for console).
     """
+    rows = _format_rows(result)
+
     if output_format == "json":
         print(format_json(result))
     elif output_format == "yaml":
         print(format_yaml(result))
     else:
-        format_console(result)
+        format_console(result, rows)
 
     # Always save markdown
-    save_markdown(result)
\ No newline at end of file
+    await save_markdown_async(result, rows=rows)
@@ -1,5 +1,6 @@
 import asyncio
 import logging
+import sys
 import typer
 from typing import List, Optional
 from src.cli.models import BenchmarkConfig
@@ -13,6 +14,15 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Use the libuv-backed uvloop event loop where installed (never on Windows)
+loop_factory = None
+if sys.platform != "win32":
+    try:
+        import uvloop
+        loop_factory = uvloop.new_event_loop
+    except ImportError:
+        pass
+
 app = typer.Typer()
 
 
@@ -31,12 +41,31 @@ def parse_concurrency(value: str) -> List[int]:
     return [int(x.strip()) for x in value.split(",")]
 
 
+def parse_request_rate(value: Optional[float]) -> Optional[float]:
+    """Validate the request arrival rate.
+
+    Args:
+        value: Requests per second, or None for no pacing.
+
+    Returns:
+        The validated rate.
+
+    Raises:
+        typer.BadParameter: If the rate is zero or negative.
+    """
+    if value is not None and value <= 0:
+        raise typer.BadParameter("must be greater than 0")
+    return value
+
+
 @app.command()
 def benchmark(
     base_url: str = typer.Option(..., "--base-url", help="API endpoint URL"),
     api_key: Optional[str] = typer.Option(None, "--api-key", help="API authentication key"),
     model: Optional[str] = typer.Option(None, "--model", help="Model name (auto-discovered if not provided)"),
     concurrency: str = typer.Option("1", "--concurrency", help="Comma-separated concurrency levels", callback=parse_concurrency),
+    request_rate: Optional[float] = typer.Option(None, "--request-rate", help="Mean request arrival rate in requests/s (default: all at once)", callback=parse_request_rate),
+    num_requests: Optional[int] = typer.Option(None, "--num-requests", min=1, help="Requests per concurrency level (default: the concurrency level)"),
     max_tokens: int = typer.Option(512, "--max-tokens", help="Maximum output tokens"),
     prompt: Optional[str] = typer.Option(None, "--prompt", help="Custom prompt text"),
     num_words: Optional[int] = typer.Option(None, "--num-words", help="Number of random words for prompt"),
@@ -52,6 +81,8 @@ def benchmark(
         api_key: Optional API key for authentication.
         model: Model name to test (auto-discovered if not provided).
         concurrency: Comma-separated list of concurrency levels to test.
+        request_rate: Mean request arrival rate in requests/second (unpaced if not set).
+        num_requests: Number of requests per concurrency level (defaults to the level).
         max_tokens: Maximum number of tokens to generate per request.
         prompt: Custom prompt text (randomly generated if not provided).
         num_words: Number of words for random prompt generation.
@@ -62,6 +93,8 @@ def benchmark(
         api_key=api_key,
         model=model,
         concurrency=concurrency,
+        request_rate=request_rate,
+        num_requests=num_requests,
         max_tokens=max_tokens,
         prompt=prompt,
         num_words=num_words,
@@ -71,13 +104,14 @@ def benchmark(
     async def main():
         try:
             result = await run_benchmark(config)
-            output_result(result, config.format)
+            await output_result(result, config.format)
         except Exception as e:
             logger.error(f"Benchmark failed: {e}")
             typer.echo(f"Error: {e}", err=True)
             raise typer.Exit(1)
 
-    asyncio.run(main())
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        runner.run(main())
 
 
 if __name__ == "__main__":
@@ -1,6 +1,6 @@
 """Data models for LLM benchmark configuration and results."""
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import List, Optional
 
 
@@ -10,14 +10,20 @@ class SpeedResult(BaseModel):
     Attributes:
         concurrency: Number of concurrent requests.
         generation_speed: Token generation speed in tokens/second.
+        generation_speed_per_user: Mean per-request generation speed in tokens/second.
         prompt_throughput: Prompt processing throughput in tokens/second.
+        effective_prompt_throughput: Prompt throughput excluding cached prompt tokens.
+        cached_token_rate: Fraction of prompt tokens served from cache (0.0 to 1.0).
         max_ttft: Maximum time to first token in seconds.
         min_ttft: Minimum time to first token in seconds.
         success_rate: Fraction of successful requests (0.0 to 1.0).
     """
     concurrency: int
     generation_speed: float  # tokens/s
+    generation_speed_per_user: float  # tokens/s
     prompt_throughput: float  # tokens/s
+    effective_prompt_throughput: float  # tokens/s
+    cached_token_rate: float  # 0.0 to 1.0
     max_ttft: float  # seconds
     min_ttft: float  # seconds
     success_rate: float  # 0.0 to 1.0
@@ -48,6 +54,8 @@ class BenchmarkConfig(BaseModel):
         api_key: Optional API authentication key.
         model: Optional model name (auto-discovered if not provided).
         concurrency: List of concurrency levels to test.
+        request_rate: Optional positive request arrival rate in requests/second (unpaced if not set).
+        num_requests: Optional number of requests per concurrency level (defaults to the level).
         max_tokens: Maximum tokens to generate per request.
         prompt: Optional custom prompt text.
         num_words: Optional number of random words for prompt generation.
@@ -57,6 +65,8 @@ class BenchmarkConfig(BaseModel):
     api_key: Optional[str] = None
     model: Optional[str] = None
     concurrency: List[int]
+    request_rate: Optional[float] = Field(default=None, gt=0)
+    num_requests: Optional[int] = Field(default=None, gt=0)
     max_tokens: int = 512
     prompt: Optional[str] = None
     num_words: Optional[int] = None
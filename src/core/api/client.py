@@ -4,7 +4,7 @@ from typing import Optional, Tuple
 
 from openai import AsyncOpenAI
 
-from src.core.constants import CHARS_PER_TOKEN, TOKENS_PER_WORD
+from src.core.constants import CHARS_PER_TOKEN, PROGRESS_BATCH_CHARS, TOKENS_PER_WORD
 
 
 async def ask_openai(
@@ -13,11 +13,11 @@ async def ask_openai(
     prompt: str,
     max_tokens: int,
     progress_callback: Optional[callable] = None,
-) -> Tuple[float, int, int]:
+) -> Tuple[float, int, int, int, float]:
     """Send a prompt to the OpenAI API and process the streaming response.
 
-    Makes a chat completion request with streaming enabled and measures time to first token,
-    while counting prompt and completion tokens.
+    Makes a chat completion request with streaming enabled and measures time to first token
+    and total request time, while counting prompt, cached prompt and completion tokens.
 
     Args:
         client: Configured AsyncOpenAI client instance.
@@ -27,18 +27,20 @@ async def ask_openai(
         progress_callback: Optional callback function called with token count updates.
 
     Returns:
-        Tuple of (time_to_first_token_seconds, completion_tokens, prompt_tokens).
+        Tuple of (time_to_first_token_seconds, completion_tokens, prompt_tokens,
+        cached_prompt_tokens, elapsed_seconds).
 
     Raises:
         Exception: If API call fails or streaming encounters errors.
     """
-    start = time.time()
+    start = time.perf_counter()
 
     time_to_first_token = 0.0
     first_token_seen = False
     last_usage = None
-    accumulated_content = ""
     estimated_tokens = 0
+    pending_parts: list[str] = []
+    pending_chars = 0
 
     stream = await client.chat.completions.create(
         model=model,
@@ -49,26 +51,47 @@ async def ask_openai(
         stream_options={"include_usage": True},
     )
 
+    # Bind hot-loop lookups to locals once per request
+    perf_counter = time.perf_counter
+    append_part = pending_parts.append
+
     async for chunk in stream:
-        if not first_token_seen and chunk.choices and chunk.choices[0].delta.content:
-            content = chunk.choices[0].delta.content.strip()
-            if content:
-                time_to_first_token = time.time() - start
+        choices = chunk.choices
+        delta = choices[0].delta if choices else None
+        content = delta.content if delta else None
+
+        if content:
+            if not first_token_seen and content.strip():
+                time_to_first_token = perf_counter() - start
                 first_token_seen = True
 
-        if chunk.choices and chunk.choices[0].delta.content:
-            content = chunk.choices[0].delta.content
-            if content:
-                accumulated_content += content
-                new_tokens = estimate_tokens(content)
+            # Estimate in bounded batches rather than per delta, so the
+            # buffer never holds more than about PROGRESS_BATCH_CHARS and the
+            # estimate is the same with or without a progress callback
+            append_part(content)
+            pending_chars += len(content)
+            if pending_chars >= PROGRESS_BATCH_CHARS:
+                new_tokens = estimate_tokens("".join(pending_parts))
                 estimated_tokens += new_tokens
                 if progress_callback:
                     progress_callback(new_tokens)
+                pending_parts.clear()
+                pending_chars = 0
 
         if chunk.usage:
             last_usage = chunk.usage
 
+    elapsed = perf_counter() - start
+
+    if pending_parts:
+        new_tokens = estimate_tokens("".join(pending_parts))
+        estimated_tokens += new_tokens
+        if progress_callback:
+            progress_callback(new_tokens)
+
     prompt_tokens = last_usage.prompt_tokens if last_usage else 0
+    # Prompt tokens served from the server's prefix cache, when reported
+    cached_tokens = getattr(getattr(last_usage, "prompt_tokens_details", None), "cached_tokens", 0) or 0
     completion_tokens = last_usage.completion_tokens if last_usage else estimated_tokens
 
     # Adjust progress bar if needed
@@ -77,37 +100,36 @@ async def ask_openai(
         if diff != 0:
             progress_callback(diff)
 
-    return time_to_first_token, completion_tokens, prompt_tokens
+    return time_to_first_token, completion_tokens, prompt_tokens, cached_tokens, elapsed
 
 
-async def ask_openai_random_input(
-    client: AsyncOpenAI,
-    model: str,
-    num_words: int,
-    max_tokens: int,
-    progress_callback: Optional[callable] = None,
-) -> Tuple[float, int, int]:
-    """Send a randomly generated prompt to the OpenAI API.
+def estimate_tokens(content: str) -> int:
+    """Cheaply estimate the number of tokens in streamed text.
 
-    Generates a random phrase and sends it as a prompt, returning the same metrics
-    as ask_openai.
+    Counts spaces instead of splitting into words so that the streaming loop
+    does no allocation: ~1.3 tokens per space-separated word, or ~3 characters
+    per token when the text contains no spaces. Use estimate_tokens_accurate
+    for one-off estimates such as the prompt.
 
     Args:
-        client: Configured AsyncOpenAI client instance.
-        model: Model name to use for the completion.
-        num_words: Number of words to include in the random prompt.
-        max_tokens: Maximum tokens to generate.
-        progress_callback: Optional callback function for token progress updates.
+        content: Text content to estimate tokens for.
 
     Returns:
-        Tuple of (time_to_first_token_seconds, completion_tokens, prompt_tokens).
+        Estimated number of tokens (0 for empty or whitespace-only content,
+        otherwise minimum 1).
     """
-    from src.core.api.prompts import generate_random_phrase
-    prompt = generate_random_phrase(num_words)
-    return await ask_openai(client, model, prompt, max_tokens, progress_callback)
+    if not content or content.isspace():
+        return 0
 
+    spaces = content.count(" ")
+    if spaces:
+        # Streamed deltas often carry a leading space that does not start a word
+        words = spaces + 1 - content.startswith(" ") - content.endswith(" ")
+        return max(1, int(words * TOKENS_PER_WORD))
+    return max(1, int(len(content) / CHARS_PER_TOKEN))
 
-def estimate_tokens(content: str) -> int:
+
+def estimate_tokens_accurate(content: str) -> int:
     """Estimate the number of tokens in a text string.
 
     Uses a heuristic approach: ~1.3 tokens per word for word-based content,
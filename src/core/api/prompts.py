@@ -10,24 +10,12 @@ from src.core.constants import (
 )
 
 
-def generate_random_word() -> str:
-    """Generate a single random word of variable length.
-
-    Creates a word using lowercase ASCII letters with length between
-    MIN_WORD_LENGTH and MAX_WORD_LENGTH.
-
-    Returns:
-        A randomly generated word string.
-    """
-    word_length = random.randint(MIN_WORD_LENGTH, MAX_WORD_LENGTH)
-    return ''.join(random.choice(string.ascii_lowercase) for _ in range(word_length))
-
-
 def generate_random_phrase(num_words: int) -> str:
     """Generate a random phrase consisting of multiple words.
 
     Creates a phrase by joining random words and wraps it in a standard
-    instruction prompt for the LLM to respond unchanged.
+    instruction prompt for the LLM to respond unchanged. All word lengths
+    and characters are sampled up front, then sliced into words.
 
     Args:
         num_words: Number of random words to include in the phrase.
@@ -35,6 +23,14 @@ def generate_random_phrase(num_words: int) -> str:
     Returns:
         Complete prompt string with instruction and random content.
     """
-    random_words = [generate_random_word() for _ in range(num_words)]
+    lengths = random.choices(range(MIN_WORD_LENGTH, MAX_WORD_LENGTH + 1), k=num_words)
+    chars = random.choices(string.ascii_lowercase, k=sum(lengths))
+
+    random_words = []
+    offset = 0
+    for length in lengths:
+        random_words.append(''.join(chars[offset:offset + length]))
+        offset += length
+
     random_phrase = ' '.join(random_words)
     return f"{PROMPT_INSTRUCTION} {random_phrase}"
\ No newline at end of file
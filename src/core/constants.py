@@ -3,6 +3,7 @@
 # Token estimation constants
 TOKENS_PER_WORD = 1.3
 CHARS_PER_TOKEN = 3.0
+PROGRESS_BATCH_CHARS = 64  # streamed characters buffered per progress update
 
 # Random prompt generation constants
 MIN_WORD_LENGTH = 3
@@ -10,6 +11,10 @@ MAX_WORD_LENGTH = 10
 DEFAULT_NUM_WORDS = 100
 PROMPT_INSTRUCTION = "Please reply back the following section unchanged:"
 
+# Warm-up request constants; the prompt must not share a prefix with measured prompts
+WARMUP_PROMPT = "Hello"
+WARMUP_MAX_TOKENS = 8
+
 # Default configuration values
 DEFAULT_MAX_TOKENS = 512
 DEFAULT_CONCURRENCY = [1]
@@ -18,4 +23,5 @@ DEFAULT_CONCURRENCY = [1]
 DEFAULT_LATENCY_ATTEMPTS = 5
 
 # Output formatting
-DEFAULT_MARKDOWN_FILENAME = "benchmark_results.md"
\ No newline at end of file
+DEFAULT_MARKDOWN_FILENAME = "benchmark_results.md"
+PLAIN_TABLE_MAX_ROWS = 8  # larger console tables are rendered with Rich
\ No newline at end of file
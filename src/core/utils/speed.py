@@ -1,11 +1,18 @@
 import asyncio
+import logging
 import math
+import random
+import statistics
 import time
-from typing import Dict, List, Optional
+from typing import AsyncIterator, Dict, List, Optional
 
 from openai import AsyncOpenAI
 
-from src.core.api.client import ask_openai, ask_openai_random_input
+from src.core.api.client import ask_openai
+from src.core.api.prompts import generate_random_phrase
+from src.core.constants import WARMUP_MAX_TOKENS, WARMUP_PROMPT
+
+logger = logging.getLogger(__name__)
 
 
 def round_to_two_decimals(f: float) -> float:
@@ -20,6 +27,31 @@ def round_to_two_decimals(f: float) -> float:
     return round(f, 2)
 
 
+async def get_request(num_requests: int, request_rate: Optional[float] = None) -> AsyncIterator[int]:
+    """Yield request indices at a target arrival rate.
+
+    Inter-arrival times are drawn from an exponential distribution, so requests
+    follow a Poisson process. Without a rate, all indices are yielded at once.
+
+    Args:
+        num_requests: Number of request indices to yield.
+        request_rate: Mean requests per second, or None for no pacing.
+
+    Yields:
+        Request indices from 0 to num_requests - 1.
+
+    Raises:
+        ValueError: If request_rate is not positive.
+    """
+    if request_rate is not None and request_rate <= 0:
+        raise ValueError("request_rate must be positive")
+
+    for i in range(num_requests):
+        if i and request_rate is not None:
+            await asyncio.sleep(random.expovariate(request_rate))
+        yield i
+
+
 async def run_speed_measurement(
     client: AsyncOpenAI,
     model_name: str,
@@ -30,6 +62,9 @@ async def run_speed_measurement(
     latency: float,  # in ms
     concurrency: int,
     progress_callback: Optional[callable] = None,
+    warmup: bool = True,
+    request_rate: Optional[float] = None,
+    num_requests: Optional[int] = None,
 ) -> Dict:
     """Run concurrent API calls and measure comprehensive performance metrics.
 
@@ -40,38 +75,61 @@ async def run_speed_measurement(
         client: Configured AsyncOpenAI client instance.
         model_name: Name of the model to test.
         prompt: Custom prompt text (ignored if use_random_input is True).
-        use_random_input: Whether to generate random prompts for each request.
+        use_random_input: Whether to generate a random prompt, shared by all requests.
         num_words: Number of words in random prompts.
         max_tokens: Maximum tokens to generate per request.
         latency: Network latency in milliseconds.
-        concurrency: Number of concurrent requests to make.
+        concurrency: Maximum number of requests in flight at once.
         progress_callback: Optional callback for progress updates.
+        warmup: Whether to send a short untimed request with WARMUP_PROMPT first so
+            that connection setup and model loading are not attributed to the
+            measured requests.
+        request_rate: Optional mean request arrival rate in requests/second; None
+            sends all requests at once.
+        num_requests: Total number of requests to send (default: concurrency).
+            Requests beyond `concurrency` in flight wait for a free slot.
 
     Returns:
         Dictionary containing measured metrics compatible with SpeedResult model.
     """
-    start_time = time.time()
+    if num_requests is None:
+        num_requests = concurrency
+
+    # Generate the random prompt once, outside the timed region
+    if use_random_input:
+        prompt = generate_random_phrase(num_words)
+
+    # Warm up with an unrelated prompt so the measured prompt stays out of
+    # the server's prefix cache
+    if warmup:
+        try:
+            await ask_openai(client, model_name, WARMUP_PROMPT, max_tokens=WARMUP_MAX_TOKENS)
+        except Exception as e:
+            logger.warning(f"Warm-up request failed: {e}")
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def limited_request():
+        async with semaphore:
+            return await ask_openai(client, model_name, prompt, max_tokens, progress_callback)
+
+    start_time = time.perf_counter()
 
     tasks = []
-    for i in range(concurrency):
-        if use_random_input:
-            task = asyncio.create_task(
-                ask_openai_random_input(client, model_name, num_words, max_tokens, progress_callback)
-            )
-        else:
-            task = asyncio.create_task(
-                ask_openai(client, model_name, prompt, max_tokens, progress_callback)
-            )
+    async for _ in get_request(num_requests, request_rate):
+        task = asyncio.create_task(limited_request())
         tasks.append(task)
 
     results = await asyncio.gather(*tasks, return_exceptions=True)
 
-    duration = time.time() - start_time
+    duration = time.perf_counter() - start_time
 
     # Process results
     ttfts = []
     response_tokens = []
     prompt_tokens_list = []
+    cached_tokens_list = []
+    per_user_speeds = []
     successful_requests = 0
     failed_requests = 0
 
@@ -79,29 +137,40 @@ async def run_speed_measurement(
         if isinstance(result, Exception):
             failed_requests += 1
             continue
-        ttft, completion_tokens, input_tokens = result
+        ttft, completion_tokens, input_tokens, cached_tokens, elapsed = result
         successful_requests += 1
         ttfts.append(ttft)
         response_tokens.append(completion_tokens)
         prompt_tokens_list.append(input_tokens)
+        cached_tokens_list.append(cached_tokens)
+        if elapsed > 0:
+            per_user_speeds.append(completion_tokens / elapsed)
 
     total_response_tokens = sum(response_tokens)
     total_prompt_tokens = sum(prompt_tokens_list)
+    total_cached_tokens = sum(cached_tokens_list)
+    effective_prompt_tokens = total_prompt_tokens - total_cached_tokens
+    cached_token_rate = total_cached_tokens / total_prompt_tokens if total_prompt_tokens > 0 else 0.0
 
-    success_rate = successful_requests / concurrency if concurrency > 0 else 0
+    success_rate = successful_requests / num_requests if num_requests > 0 else 0.0
 
-    min_ttft = min(ttfts) if ttfts else 0
-    max_ttft = max(ttfts) if ttfts else 0
+    min_ttft = min(ttfts) if ttfts else 0.0
+    max_ttft = max(ttfts) if ttfts else 0.0
 
     # Calculate speeds
     latency_sec = latency / 1000
-    generation_speed = total_response_tokens / (duration - latency_sec) if duration > latency_sec else 0
-    prompt_throughput = total_prompt_tokens / (max_ttft - latency_sec) if max_ttft > latency_sec else 0
+    generation_speed = total_response_tokens / (duration - latency_sec) if duration > latency_sec else 0.0
+    prompt_throughput = total_prompt_tokens / (max_ttft - latency_sec) if max_ttft > latency_sec else 0.0
+    effective_prompt_throughput = effective_prompt_tokens / (max_ttft - latency_sec) if max_ttft > latency_sec else 0.0
+    generation_speed_per_user = statistics.mean(per_user_speeds) if per_user_speeds else 0.0
 
     return {
         "concurrency": concurrency,
         "generation_speed": round_to_two_decimals(generation_speed),
+        "generation_speed_per_user": round_to_two_decimals(generation_speed_per_user),
         "prompt_throughput": round_to_two_decimals(prompt_throughput),
+        "effective_prompt_throughput": round_to_two_decimals(effective_prompt_throughput),
+        "cached_token_rate": cached_token_rate,
         "max_ttft": round_to_two_decimals(max_ttft),
         "min_ttft": round_to_two_decimals(min_ttft),
         "success_rate": success_rate,
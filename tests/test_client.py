@@ -0,0 +1,118 @@
+from types import SimpleNamespace
+
+import pytest
+from src.core.api.client import ask_openai, estimate_tokens, estimate_tokens_accurate
+
+
+def make_client(deltas, usage=None):
+    """Build a fake AsyncOpenAI client streaming the given content deltas."""
+    chunks = [
+        SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=delta))], usage=None)
+        for delta in deltas
+    ]
+    if usage is not None:
+        chunks.append(SimpleNamespace(choices=[], usage=usage))
+
+    async def stream():
+        for chunk in chunks:
+            yield chunk
+
+    async def create(**kwargs):
+        return stream()
+
+    return SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+
+
+DELTAS = [" hello"] * 50 + ["\n", " world."]
+
+
+@pytest.mark.parametrize(
+    "content, expected",
+    [
+        ("", 0),
+        (" ", 0),
+        ("\n\t ", 0),
+        ("world", 1),
+        (" world", 1),
+        ("world ", 1),
+        (" world ", 1),
+        ("hello world", 2),
+        ("one two three four", 5),
+        ("abcdefghi", 3),
+        ("ab", 1),
+    ],
+)
+def test_estimate_tokens(content, expected):
+    assert estimate_tokens(content) == expected
+
+
+@pytest.mark.parametrize(
+    "content, expected",
+    [
+        ("", 0),
+        ("   ", 0),
+        ("  hello world  ", 2),
+        ("one two three four", 5),
+        ("abcdefghi", 1),
+    ],
+)
+def test_estimate_tokens_accurate(content, expected):
+    assert estimate_tokens_accurate(content) == expected
+
+
+@pytest.mark.asyncio
+async def test_ask_openai_estimate_without_usage_ignores_progress_callback():
+    _, without_callback, _, _, _ = await ask_openai(make_client(DELTAS), "model", "prompt", 64)
+
+    updates = []
+    _, with_callback, _, _, _ = await ask_openai(make_client(DELTAS), "model", "prompt", 64, updates.append)
+
+    assert without_callback == with_callback > 0
+    assert sum(updates) == with_callback
+
+
+@pytest.mark.asyncio
+async def test_ask_openai_returns_timings_and_usage():
+    usage = SimpleNamespace(
+        prompt_tokens=100,
+        completion_tokens=80,
+        prompt_tokens_details=SimpleNamespace(cached_tokens=40),
+    )
+    result = await ask_openai(make_client(DELTAS, usage), "model", "prompt", 64)
+
+    assert len(result) == 5
+    ttft, completion_tokens, prompt_tokens, cached_tokens, elapsed = result
+    assert (completion_tokens, prompt_tokens, cached_tokens) == (80, 100, 40)
+    assert 0 < ttft <= elapsed
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "usage",
+    [
+        SimpleNamespace(prompt_tokens=100, completion_tokens=80),
+        SimpleNamespace(prompt_tokens=100, completion_tokens=80, prompt_tokens_details=None),
+        SimpleNamespace(
+            prompt_tokens=100,
+            completion_tokens=80,
+            prompt_tokens_details=SimpleNamespace(cached_tokens=None),
+        ),
+    ],
+)
+async def test_ask_openai_without_cached_tokens(usage):
+    _, _, _, cached_tokens, _ = await ask_openai(make_client(DELTAS, usage), "model", "prompt", 64)
+    assert cached_tokens == 0
+
+
+@pytest.mark.asyncio
+async def test_ask_openai_progress_matches_reported_usage():
+    usage = SimpleNamespace(prompt_tokens=100, completion_tokens=80)
+    updates = []
+    _, completion_tokens, _, _, _ = await ask_openai(
+        make_client(DELTAS, usage), "model", "prompt", 64, updates.append
+    )
+
+    assert completion_tokens == 80
+    # Batched estimates plus the final adjustment add up to the server's count
+    assert len(updates) > 1
+    assert sum(updates) == 80
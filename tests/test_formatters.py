@@ -0,0 +1,123 @@
+from src.cli.formatters import (
+    TABLE_HEADERS,
+    _format_rows,
+    _print_plain_table,
+    format_console,
+    format_markdown,
+)
+from src.cli.models import BenchmarkResult, SpeedResult
+
+
+def make_result():
+    return BenchmarkResult(
+        model_name="gpt-4",
+        input_tokens=45,
+        output_tokens=512,
+        latency=2.2,
+        results=[
+            SpeedResult(
+                concurrency=1,
+                generation_speed=58.49,
+                generation_speed_per_user=58.12,
+                prompt_throughput=846.81,
+                effective_prompt_throughput=423.4,
+                cached_token_rate=0.5,
+                max_ttft=0.05,
+                min_ttft=0.05,
+                success_rate=1.0,
+            ),
+            SpeedResult(
+                concurrency=16,
+                generation_speed=412.3,
+                generation_speed_per_user=25.77,
+                prompt_throughput=1234.5,
+                effective_prompt_throughput=1234.5,
+                cached_token_rate=0.0,
+                max_ttft=1.25,
+                min_ttft=0.12,
+                success_rate=0.9375,
+            ),
+        ],
+    )
+
+
+def test_table_headers_order():
+    assert TABLE_HEADERS == (
+        "Concurrency",
+        "Generation Throughput (tokens/s)",
+        "Per-User Generation (tokens/s)",
+        "Prompt Throughput (tokens/s)",
+        "Effective Prompt Throughput (tokens/s)",
+        "Cached Token Rate",
+        "Min TTFT (s)",
+        "Max TTFT (s)",
+        "Success Rate",
+    )
+
+
+def test_format_rows():
+    rows = _format_rows(make_result())
+    assert rows == [
+        ("1", "58.49", "58.12", "846.81", "423.40", "50.00%", "0.05", "0.05", "100.00%"),
+        ("16", "412.30", "25.77", "1234.50", "1234.50", "0.00%", "0.12", "1.25", "93.75%"),
+    ]
+    assert all(len(row) == len(TABLE_HEADERS) for row in rows)
+
+
+def test_format_markdown_layout():
+    lines = format_markdown(make_result()).split("\n")
+    assert lines[:5] == [
+        "Input Tokens: 45",
+        "Output Tokens: 512",
+        "Test Model: gpt-4",
+        "Latency: 2.20 ms",
+        "",
+    ]
+    assert lines[5] == "| " + " | ".join(TABLE_HEADERS) + " |"
+    assert lines[6] == "| --- | --- | --- | --- | --- | --- | --- | --- | --- |"
+    assert lines[7] == "| 1 | 58.49 | 58.12 | 846.81 | 423.40 | 50.00% | 0.05 | 0.05 | 100.00% |"
+    assert lines[8] == "| 16 | 412.30 | 25.77 | 1234.50 | 1234.50 | 0.00% | 0.12 | 1.25 | 93.75% |"
+    assert len(lines) == 9
+
+
+def test_format_markdown_uses_given_rows():
+    rows = [tuple(str(i) for i in range(len(TABLE_HEADERS)))]
+    lines = format_markdown(make_result(), rows).split("\n")
+    assert lines[7:] == ["| 0 | 1 | 2 | 3 | 4 | 5 | 6 | 7 | 8 |"]
+
+
+def test_print_plain_table_alignment(capsys):
+    result = make_result()
+    _print_plain_table(result, _format_rows(result))
+    lines = capsys.readouterr().out.splitlines()
+
+    assert lines[:4] == [
+        "Input Tokens: 45",
+        "Output Tokens: 512",
+        "Test Model: gpt-4",
+        "Latency: 2.20 ms",
+    ]
+    table = lines[5:]
+    assert table[0] == "  ".join(TABLE_HEADERS)
+    # Cells are right-aligned under their headers
+    assert table[1] == "  ".join(
+        cell.rjust(len(header)) for cell, header in zip(_format_rows(result)[0], TABLE_HEADERS)
+    )
+    assert table[1].startswith(" " * 10 + "1  ")
+    assert table[2].endswith("93.75%")
+    assert len({len(line) for line in table}) == 1
+
+
+def test_print_plain_table_widens_columns_for_long_cells(capsys):
+    rows = [("123456789012345",) + ("x",) * (len(TABLE_HEADERS) - 1)]
+    _print_plain_table(make_result(), rows)
+    table = capsys.readouterr().out.splitlines()[5:]
+    assert table[0].startswith(" " * 4 + "Concurrency  ")
+    assert table[1].startswith("123456789012345  ")
+
+
+def test_format_console_prints_plain_table_when_not_a_tty(capsys):
+    assert format_console(make_result()) == ""
+    out = capsys.readouterr().out
+    assert "Test Model: gpt-4" in out
+    assert "  ".join(TABLE_HEADERS) in out
@@ -1,4 +1,5 @@
 import pytest
+from pydantic import ValidationError
 from src.cli.models import BenchmarkConfig, BenchmarkResult, SpeedResult
 
 
@@ -6,13 +7,18 @@ def test_speed_result():
     result = SpeedResult(
         concurrency=1,
         generation_speed=58.49,
+        generation_speed_per_user=58.12,
         prompt_throughput=846.81,
+        effective_prompt_throughput=423.4,
+        cached_token_rate=0.5,
         max_ttft=0.05,
         min_ttft=0.05,
         success_rate=1.0,
     )
     assert result.concurrency == 1
     assert result.generation_speed == 58.49
+    assert result.generation_speed_per_user == 58.12
+    assert result.cached_token_rate == 0.5
 
 
 def test_benchmark_result():
@@ -20,7 +26,10 @@ def test_benchmark_result():
         SpeedResult(
             concurrency=1,
             generation_speed=58.49,
+            generation_speed_per_user=58.12,
             prompt_throughput=846.81,
+            effective_prompt_throughput=423.4,
+            cached_token_rate=0.5,
             max_ttft=0.05,
             min_ttft=0.05,
             success_rate=1.0,
@@ -49,4 +58,26 @@ def test_benchmark_config():
         format="json",
     )
     assert config.base_url == "https://api.example.com/v1"
-    assert config.concurrency == [1, 2, 4]
\ No newline at end of file
+    assert config.concurrency == [1, 2, 4]
+    assert config.request_rate is None
+    assert config.num_requests is None
+
+
+@pytest.mark.parametrize("request_rate", [0, -1.0])
+def test_benchmark_config_rejects_non_positive_request_rate(request_rate):
+    with pytest.raises(ValidationError):
+        BenchmarkConfig(
+            base_url="https://api.example.com/v1",
+            concurrency=[1],
+            request_rate=request_rate,
+        )
+
+
+@pytest.mark.parametrize("num_requests", [0, -1])
+def test_benchmark_config_rejects_non_positive_num_requests(num_requests):
+    with pytest.raises(ValidationError):
+        BenchmarkConfig(
+            base_url="https://api.example.com/v1",
+            concurrency=[1],
+            num_requests=num_requests,
+        )
@@ -0,0 +1,27 @@
+import random
+import string
+
+from src.core.api.prompts import generate_random_phrase
+from src.core.constants import MAX_WORD_LENGTH, MIN_WORD_LENGTH, PROMPT_INSTRUCTION
+
+
+def test_generate_random_phrase():
+    phrase = generate_random_phrase(100)
+    assert phrase.startswith(f"{PROMPT_INSTRUCTION} ")
+
+    words = phrase[len(PROMPT_INSTRUCTION) + 1:].split(" ")
+    assert len(words) == 100
+    for word in words:
+        assert MIN_WORD_LENGTH <= len(word) <= MAX_WORD_LENGTH
+        assert set(word) <= set(string.ascii_lowercase)
+
+
+def test_generate_random_phrase_no_words():
+    assert generate_random_phrase(0) == f"{PROMPT_INSTRUCTION} "
+
+
+def test_generate_random_phrase_is_seedable():
+    random.seed(1234)
+    first = generate_random_phrase(10)
+    random.seed(1234)
+    assert generate_random_phrase(10) == first
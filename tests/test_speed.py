@@ -0,0 +1,142 @@
+import asyncio
+
+import pytest
+from src.core.utils import speed
+from src.core.utils.speed import get_request, run_speed_measurement
+
+
+async def measure(**kwargs):
+    """Run run_speed_measurement without a warm-up, using test defaults."""
+    options = dict(
+        client=None,
+        model_name="model",
+        prompt="prompt",
+        use_random_input=False,
+        num_words=0,
+        max_tokens=16,
+        latency=0,
+        concurrency=1,
+        warmup=False,
+    )
+    options.update(kwargs)
+    return await run_speed_measurement(**options)
+
+
+def stub_ask_openai(monkeypatch, results):
+    """Make ask_openai return (or raise) the given results in call order."""
+    pending = iter(results)
+
+    async def fake_ask_openai(*args, **kwargs):
+        result = next(pending)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    monkeypatch.setattr(speed, "ask_openai", fake_ask_openai)
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    recorded = []
+
+    async def fake_sleep(delay):
+        recorded.append(delay)
+
+    monkeypatch.setattr(speed.asyncio, "sleep", fake_sleep)
+    monkeypatch.setattr(speed.random, "expovariate", lambda rate: 1 / rate)
+    return recorded
+
+
+@pytest.mark.asyncio
+async def test_get_request_unpaced(sleeps):
+    assert [i async for i in get_request(3)] == [0, 1, 2]
+    assert sleeps == []
+
+
+@pytest.mark.asyncio
+async def test_get_request_paced(sleeps):
+    assert [i async for i in get_request(3, request_rate=4.0)] == [0, 1, 2]
+    # No wait before the first request, one exponential gap before each later one
+    assert sleeps == [0.25, 0.25]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("request_rate", [0.0, -1.0])
+async def test_get_request_rejects_non_positive_rate(request_rate):
+    with pytest.raises(ValueError):
+        [i async for i in get_request(3, request_rate)]
+
+
+@pytest.mark.asyncio
+async def test_run_speed_measurement_caps_in_flight_requests(monkeypatch):
+    calls = 0
+    in_flight = 0
+    peak = 0
+
+    async def fake_ask_openai(*args, **kwargs):
+        nonlocal calls, in_flight, peak
+        calls += 1
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return 0.1, 10, 100, 0, 0.5
+
+    monkeypatch.setattr(speed, "ask_openai", fake_ask_openai)
+    result = await measure(concurrency=2, num_requests=6)
+
+    assert calls == 6
+    assert peak == 2
+    assert result["concurrency"] == 2
+    assert result["success_rate"] == 1.0
+
+
+@pytest.mark.asyncio
+async def test_run_speed_measurement_cached_tokens(monkeypatch):
+    stub_ask_openai(monkeypatch, [
+        (0.2, 10, 100, 40, 1.0),
+        (0.5, 10, 100, 60, 1.0),
+    ])
+    result = await measure(concurrency=2, latency=100)
+
+    assert result["cached_token_rate"] == 0.5
+    # 200 prompt tokens, 100 of them uncached, over max TTFT minus latency (0.4 s)
+    assert result["prompt_throughput"] == pytest.approx(500.0)
+    assert result["effective_prompt_throughput"] == pytest.approx(250.0)
+    assert result["max_ttft"] == 0.5
+    assert result["min_ttft"] == 0.2
+
+
+@pytest.mark.asyncio
+async def test_run_speed_measurement_without_prompt_tokens(monkeypatch):
+    stub_ask_openai(monkeypatch, [(0.2, 10, 0, 0, 1.0)])
+    result = await measure()
+
+    assert result["cached_token_rate"] == 0.0
+    assert result["prompt_throughput"] == 0.0
+    assert result["effective_prompt_throughput"] == 0.0
+
+
+@pytest.mark.asyncio
+async def test_run_speed_measurement_per_user_speed(monkeypatch):
+    stub_ask_openai(monkeypatch, [
+        (0.1, 100, 10, 0, 2.0),
+        (0.1, 300, 10, 0, 3.0),
+        (0.1, 50, 10, 0, 0.0),  # zero elapsed is left out of the mean
+        RuntimeError("request failed"),
+    ])
+    result = await measure(concurrency=4)
+
+    # mean(100 / 2.0, 300 / 3.0)
+    assert result["generation_speed_per_user"] == 75.0
+    assert result["success_rate"] == 0.75
+
+
+@pytest.mark.asyncio
+async def test_run_speed_measurement_per_user_speed_without_successes(monkeypatch):
+    stub_ask_openai(monkeypatch, [RuntimeError("request failed")] * 2)
+    result = await measure(concurrency=2)
+
+    assert result["generation_speed_per_user"] == 0.0
+    assert result["generation_speed"] == 0.0
+    assert result["success_rate"] == 0.0